@@ -21,3 +21,10 @@ class GCSConnector(GoogleCloudConnector):
 
     def get_blob(self, bucket_name, blob_name):
         return self.get_bucket(bucket_name).get_blob(blob_name)
+
+    def get_blob_reference(self, bucket_name, blob_name):
+        # Builds the blob locally so the download is the only request.
+        return self.client.bucket(bucket_name).blob(blob_name)
+
+    def download_blob(self, bucket_name, blob_name):
+        return self.get_blob_reference(bucket_name, blob_name).download_as_bytes()
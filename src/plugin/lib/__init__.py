@@ -0,0 +1,3 @@
+from .row_batch import ColumnTable, Row, RowBatch
+from .profiler import CollectProfiler
+from .csv_parser import read_csv, sniff_delimiter
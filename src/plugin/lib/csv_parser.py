@@ -0,0 +1,62 @@
+import csv
+import io
+import logging
+from typing import Optional
+
+import pandas as pd
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+
+__all__ = ["CSV_ENGINES", "read_csv", "sniff_delimiter"]
+
+_LOGGER = logging.getLogger("spaceone")
+
+CSV_ENGINES = ["c", "python"]
+DEFAULT_ENGINE = "c"
+DEFAULT_ENCODING = "utf-8"
+DEFAULT_DELIMITER = ","
+DEFAULT_QUOTECHAR = '"'
+SNIFF_SAMPLE_SIZE = 64 * 1024
+SNIFF_DELIMITERS = ",;\t|"
+
+
+def sniff_delimiter(data: bytes, encoding: str) -> str:
+    # Only the header line is sniffed: data values such as 'legacy' would
+    # otherwise make the sniffer guess a wrong quote character.
+    header = data[:SNIFF_SAMPLE_SIZE].decode(encoding, errors="ignore")
+    header = header.splitlines()[0] if header else ""
+
+    try:
+        delimiter = csv.Sniffer().sniff(header, delimiters=SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return DEFAULT_DELIMITER
+
+    if delimiter != DEFAULT_DELIMITER and len(header.split(delimiter)) < 2:
+        return DEFAULT_DELIMITER
+
+    _LOGGER.debug(f"[sniff_delimiter] Detected CSV delimiter: {delimiter!r}")
+    return delimiter
+
+
+def read_csv(
+    data: bytes,
+    engine: Optional[str] = None,
+    encoding: Optional[str] = None,
+    delimiter: Optional[str] = None,
+    quotechar: Optional[str] = None,
+) -> pd.DataFrame:
+    engine = engine or DEFAULT_ENGINE
+    encoding = encoding or DEFAULT_ENCODING
+
+    if engine not in CSV_ENGINES:
+        raise ERROR_INVALID_PARAMETER(
+            key="options.csv_engine", reason=f"Choose one of {CSV_ENGINES}"
+        )
+
+    return pd.read_csv(
+        io.BytesIO(data),
+        engine=engine,
+        encoding=encoding,
+        sep=delimiter or sniff_delimiter(data, encoding),
+        quotechar=quotechar or DEFAULT_QUOTECHAR,
+    )
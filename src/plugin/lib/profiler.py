@@ -0,0 +1,200 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from typing import Generator, Iterator, Optional
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+
+__all__ = ["CollectProfiler"]
+
+_LOGGER = logging.getLogger("spaceone")
+
+PROFILE_MODE_ENV = "CSV_COLLECTOR_PROFILE"
+PROFILE_PATH_ENV = "CSV_COLLECTOR_PROFILE_PATH"
+PROFILE_MODES = ["cprofile", "tracemalloc"]
+PROFILE_STAGES = ["collect_resources", "collect_cloud_services", "make_cloud_service"]
+PROFILE_STAGE_FILES = ["plugin/manager/base.py", "plugin/manager/asset_manager.py"]
+REPORT_LIMIT = 30
+TRACEMALLOC_FRAMES = 25
+
+# cProfile and tracemalloc both hook the whole interpreter, so only one
+# collect run is profiled at a time.
+_PROFILE_LOCK = threading.Lock()
+
+
+class CollectProfiler:
+    """Wraps one Collector.collect run in cProfile or tracemalloc."""
+
+    def __init__(self, mode: str, output_dir: str):
+        if mode not in PROFILE_MODES:
+            raise ERROR_INVALID_PARAMETER(
+                key="options.profile_mode", reason=f"Choose one of {PROFILE_MODES}"
+            )
+
+        self.mode = mode
+        self.output_dir = output_dir
+        self.profile = None
+        self.duration = 0.0
+        self.snapshot = None
+        self.snapshot_memory = 0
+        self.peak_memory = 0
+
+    @classmethod
+    def from_options(cls, options: dict) -> Optional["CollectProfiler"]:
+        mode = options.get("profile_mode") or os.environ.get(PROFILE_MODE_ENV)
+        if not mode:
+            return None
+
+        output_dir = (
+            options.get("profile_path")
+            or os.environ.get(PROFILE_PATH_ENV)
+            or tempfile.gettempdir()
+        )
+        return cls(mode.lower(), output_dir)
+
+    def run(self, iterator: Iterator[dict]) -> Generator[dict, None, None]:
+        if not _PROFILE_LOCK.acquire(blocking=False):
+            _LOGGER.warning(
+                "[CollectProfiler] Another collect is being profiled, "
+                "collecting without profiling"
+            )
+            yield from iterator
+            return
+
+        try:
+            yield from self._run(iterator)
+        finally:
+            _PROFILE_LOCK.release()
+
+    def _run(self, iterator: Iterator[dict]) -> Generator[dict, None, None]:
+        # cProfile is switched on only while the wrapped generator produces a
+        # response, so time spent by the server sending it is not counted.
+        if self.mode == "cprofile":
+            self.profile = cProfile.Profile()
+        else:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+        try:
+            is_group_start = True
+            while True:
+                start_time = time.perf_counter()
+                self._enable()
+                try:
+                    response = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    self._disable()
+                    self.duration += time.perf_counter() - start_time
+
+                # The first cloud service of a group is yielded while its
+                # DataFrame and rows are still alive, so that is where the
+                # group's allocations are captured.
+                if is_group_start and self.mode == "tracemalloc":
+                    self._take_snapshot()
+
+                is_group_start = (
+                    response.get("resource_type") != "inventory.CloudService"
+                )
+
+                yield response
+        finally:
+            if self.mode == "tracemalloc":
+                self.peak_memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self._write_report()
+
+    def _take_snapshot(self):
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self.snapshot_memory:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_memory = current
+
+    def _enable(self):
+        if self.profile:
+            self.profile.enable()
+
+    def _disable(self):
+        if self.profile:
+            self.profile.disable()
+
+    def _write_report(self):
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            file_prefix = os.path.join(
+                self.output_dir,
+                f"collect-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-"
+                f"{uuid.uuid4().hex[:8]}",
+            )
+
+            if self.mode == "cprofile":
+                report_path = self._write_cprofile_report(file_prefix)
+            else:
+                report_path = self._write_tracemalloc_report(file_prefix)
+
+            _LOGGER.info(
+                f"[CollectProfiler] {self.mode} report written to {report_path} "
+                f"(duration: {self.duration:.2f}s)"
+            )
+        except Exception as e:
+            _LOGGER.error(f"[CollectProfiler] Failed to write report: {e}", exc_info=True)
+
+    def _write_cprofile_report(self, file_prefix: str) -> str:
+        self.profile.dump_stats(f"{file_prefix}.prof")
+
+        stage_pattern = r"\((" + "|".join(PROFILE_STAGES) + r")\)"
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        stats.print_stats(stage_pattern)
+        stats.print_callees(stage_pattern)
+        stats.print_stats(REPORT_LIMIT)
+
+        report_path = f"{file_prefix}.txt"
+        with open(report_path, "w") as f:
+            f.write(stream.getvalue())
+
+        return report_path
+
+    def _write_tracemalloc_report(self, file_prefix: str) -> str:
+        lines = [
+            f"peak: {self.peak_memory / 1024:.1f} KiB, "
+            f"largest group snapshot: {self.snapshot_memory / 1024:.1f} KiB",
+        ]
+
+        if self.snapshot:
+            snapshot = self.snapshot.filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                ]
+            )
+            stage_snapshot = snapshot.filter_traces(
+                [
+                    tracemalloc.Filter(True, f"*{path}", all_frames=True)
+                    for path in PROFILE_STAGE_FILES
+                ]
+            )
+
+            lines.extend(["", f"Top allocations in {', '.join(PROFILE_STAGES)}:"])
+            lines.extend(
+                str(stat)
+                for stat in stage_snapshot.statistics("lineno")[:REPORT_LIMIT]
+            )
+            lines.extend(["", "Top allocations overall:"])
+            lines.extend(
+                str(stat) for stat in snapshot.statistics("lineno")[:REPORT_LIMIT]
+            )
+
+        report_path = f"{file_prefix}.txt"
+        with open(report_path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+        return report_path
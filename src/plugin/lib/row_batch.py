@@ -0,0 +1,68 @@
+import sys
+from typing import Any, Iterable, Iterator, Tuple
+
+import pandas as pd
+
+__all__ = ["ColumnTable", "Row", "RowBatch"]
+
+
+class ColumnTable:
+    """Column names shared by every row of a batch."""
+
+    __slots__ = ("names", "positions")
+
+    def __init__(self, names: Iterable[str]):
+        self.names = tuple(sys.intern(str(name)) for name in names)
+        self.positions = {name: index for index, name in enumerate(self.names)}
+
+    def select(self, exclude: Iterable[str] = ()) -> Tuple[Tuple[str, int], ...]:
+        excluded = set(exclude)
+        return tuple(
+            (name, index)
+            for index, name in enumerate(self.names)
+            if name not in excluded
+        )
+
+
+class Row:
+    __slots__ = ("columns", "values")
+
+    def __init__(self, columns: ColumnTable, values: tuple):
+        self.columns = columns
+        self.values = values
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[self.columns.positions[name]]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        index = self.columns.positions.get(name)
+        return default if index is None else self.values[index]
+
+    def to_dict(self, selection: Tuple[Tuple[str, int], ...]) -> dict:
+        values = self.values
+        return {name: values[index] for name, index in selection}
+
+
+class RowBatch:
+    """Rows are produced lazily and can be iterated only once."""
+
+    __slots__ = ("columns", "rows", "size")
+
+    def __init__(self, columns: ColumnTable, rows: Iterable[tuple], size: int):
+        self.columns = columns
+        self.rows = rows
+        self.size = size
+
+    @classmethod
+    def from_data_frame(cls, data_frame: pd.DataFrame) -> "RowBatch":
+        columns = ColumnTable(data_frame.columns)
+        rows = data_frame.itertuples(index=False, name=None)
+        return cls(columns, rows, len(data_frame))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Row]:
+        columns = self.columns
+        for values in self.rows:
+            yield Row(columns, values)
@@ -6,6 +6,9 @@ from spaceone.core.error import ERROR_REQUIRED_PARAMETER
 from spaceone.inventory.plugin.collector.lib.server import CollectorPluginServer
 from .manager import AssetManager
 from .manager import StorageManager
+from .lib import CollectProfiler
+from .lib.csv_parser import CSV_ENGINES
+from .lib.profiler import PROFILE_MODES
 
 app = CollectorPluginServer()
 
@@ -35,11 +38,11 @@ def collector_collect(params: dict) -> Generator[dict, None, None]:
         f"[collector_collect] Start Collecting Cloud Resources (project_id: {project_id}, bucket_name: {bucket_name})"
     )
 
-    assets_info = StorageManager().get_assets_info(options, secret_data)
-    for asset_info in assets_info:
-        yield from AssetManager(
-            asset_info=asset_info, options=options, secret_data=secret_data
-        ).collect_resources(options, secret_data, schema)
+    responses = _collect_assets(options, secret_data, schema)
+    if profiler := CollectProfiler.from_options(options):
+        responses = profiler.run(responses)
+
+    yield from responses
 
     _LOGGER.debug(
         f"[collector_collect] Finished Collecting Cloud Resources "
@@ -47,6 +50,22 @@ def collector_collect(params: dict) -> Generator[dict, None, None]:
     )
 
 
+def _collect_assets(
+    options: dict, secret_data: dict, schema: str
+) -> Generator[dict, None, None]:
+    storage_manager = StorageManager()
+    assets_info = storage_manager.get_assets_info(options, secret_data)
+    for asset_info in assets_info:
+        yield from AssetManager(
+            asset_info=asset_info, options=options, secret_data=secret_data
+        ).collect_resources(options, secret_data, schema)
+
+    for asset_info in storage_manager.get_unlisted_assets_info():
+        yield from AssetManager(
+            asset_info=asset_info, options=options, secret_data=secret_data
+        ).collect_resources(options, secret_data, schema)
+
+
 def _create_init_metadata() -> dict:
     return {
         "metadata": {
@@ -63,7 +82,55 @@ def _create_init_metadata() -> dict:
                         "type": "string",
                         "title": "Bucket Name",
                         "description": "The name of the Google Cloud Storage bucket",
-                    }
+                    },
+                    "csv_engine": {
+                        "type": "string",
+                        "title": "CSV Parser Engine",
+                        "description": "The pandas parser engine used to read CSV files",
+                        "enum": CSV_ENGINES,
+                        "default": "c",
+                    },
+                    "csv_encoding": {
+                        "type": "string",
+                        "title": "CSV Encoding",
+                        "description": "The encoding of the CSV files",
+                        "default": "utf-8",
+                    },
+                    "csv_delimiter": {
+                        "type": "string",
+                        "title": "CSV Delimiter",
+                        "description": "The field delimiter, detected from the file when omitted",
+                    },
+                    "csv_quotechar": {
+                        "type": "string",
+                        "title": "CSV Quote Character",
+                        "description": "The character used to quote fields",
+                        "default": '"',
+                    },
+                    "manifest_file": {
+                        "type": "string",
+                        "title": "Manifest File",
+                        "description": "Manifest object at the bucket root listing the asset files, empty to disable",
+                        "default": "_manifest.json",
+                    },
+                    "verify_manifest": {
+                        "type": "boolean",
+                        "title": "Verify Manifest",
+                        "description": "List the bucket after collecting to find groups missing from the manifest. "
+                        "This costs one bucket listing per run on top of the manifest GET",
+                        "default": False,
+                    },
+                    "profile_mode": {
+                        "type": "string",
+                        "title": "Profile Mode",
+                        "description": "Profile one collect run with cProfile or tracemalloc",
+                        "enum": PROFILE_MODES,
+                    },
+                    "profile_path": {
+                        "type": "string",
+                        "title": "Profile Path",
+                        "description": "Local directory the profile report is written to",
+                    },
                 },
                 "required": ["bucket_name"],
             },
@@ -1,13 +1,15 @@
 import logging
 import yaml
-import io
-import pandas as pd
 import numpy as np
+import pandas as pd
 from typing import Generator
+from google.api_core.exceptions import NotFound
 from spaceone.inventory.plugin.collector.lib import *
 from spaceone.core.error import *
 from plugin.manager.base import ResourceManager
 from plugin.connector.gcs_connector import GCSConnector
+from plugin.lib.row_batch import Row, RowBatch
+from plugin.lib.csv_parser import read_csv
 
 _LOGGER = logging.getLogger("spaceone")
 
@@ -25,11 +27,16 @@ class AssetManager(ResourceManager):
         self.cloud_service_group = asset_info["cloud_service_group"]
         self.cloud_service_type = asset_info["cloud_service_type"]
         self.csv_file_path = asset_info["csv_file_path"]
+        self.csv_generation = asset_info.get("csv_generation")
 
         self.metadata = {}
+        self.data_columns = ()
+        self.csv_options = {}
 
         if metadata_file_path := asset_info.get("metadata_file_path"):
-            self._initialize_metadata(metadata_file_path)
+            self._initialize_metadata(
+                metadata_file_path, asset_info.get("metadata_generation")
+            )
 
         if "is_primary" in asset_info:
             self.is_primary = asset_info["is_primary"]
@@ -37,44 +44,49 @@ class AssetManager(ResourceManager):
         if "unique_key" in asset_info:
             self.unique_key = asset_info["unique_key"]
 
+        self.resource_id_key = self.unique_key if self.unique_key else "unique_id"
+        self.resource_id_prefix = (
+            f"{self.provider}:{self.cloud_service_group}:{self.cloud_service_type}:"
+        )
+
     def collect_cloud_services(
         self, options: dict, secret_data: dict, schema: str
     ) -> Generator[dict, None, None]:
 
-        bucket_name, csv_file_path = self.csv_file_path.split("/", 1)
-        bucket = self.gcs_connector.get_bucket(bucket_name)
-        blob = bucket.get_blob(csv_file_path)
-        text = blob.download_as_text()
-        data_frame = pd.read_csv(io.StringIO(text))
+        data_frame = read_csv(
+            self._download_file(self.csv_file_path, self.csv_generation),
+            engine=options.get("csv_engine"),
+            encoding=self.csv_options.get("encoding", options.get("csv_encoding")),
+            delimiter=self.csv_options.get("delimiter", options.get("csv_delimiter")),
+            quotechar=self.csv_options.get("quotechar", options.get("csv_quotechar")),
+        )
         data_frame = data_frame.replace({np.nan: None})
+        self._check_data_columns(list(data_frame.columns))
+        self._add_default_resource_id(data_frame)
+        row_batch = RowBatch.from_data_frame(data_frame)
 
         _LOGGER.debug(
             f"[{self.__repr__()}] {self.cloud_service_group} > {self.cloud_service_type}: "
-            f"Dataset Row Count: {len(data_frame)}"
+            f"Dataset Row Count: {len(row_batch)}"
         )
 
-        columns = list(data_frame.columns)
-        self._check_data_columns(columns)
+        columns = list(row_batch.columns.names)
 
         if not self.metadata:
             self._create_default_metadata(columns)
 
-        for index, row in data_frame.iterrows():
+        self.data_columns = row_batch.columns.select(exclude=STRUCTURED_COLUMNS)
+
+        for row in row_batch:
             yield self.make_cloud_service(row)
 
-    def make_cloud_service(self, row: pd.Series) -> dict:
+    def make_cloud_service(self, row: Row) -> dict:
         name = row["name"]
         account = row.get("account")
         region_code = row.get("region_code")
-        resource_id = row.get("resource_id", self._get_default_resource_id(row, name))
+        resource_id = row["resource_id"]
 
-        columns = list(row.index)
-
-        data = {
-            column: row[column]
-            for column in columns
-            if column not in STRUCTURED_COLUMNS
-        }
+        data = row.to_dict(self.data_columns)
 
         return make_cloud_service(
             name=name,
@@ -108,13 +120,13 @@ class AssetManager(ResourceManager):
             match_keys=[["name", "group", "provider"]],
         )
 
-    def _initialize_metadata(self, metadata_file_path):
-        bucket_name, metadata_file_path = metadata_file_path.split("/", 1)
-        bucket = self.gcs_connector.get_bucket(bucket_name)
-        blob = bucket.get_blob(metadata_file_path)
+    def _initialize_metadata(self, metadata_file_path, generation=None):
+        try:
+            metadata = self._download_file(metadata_file_path, generation)
+        except NotFound:
+            metadata = None
 
-        if blob:
-            metadata = blob.download_as_text()
+        if metadata:
             metadata_dict = self.yaml_to_dict(metadata)
 
             if "icon" in metadata_dict:
@@ -132,6 +144,28 @@ class AssetManager(ResourceManager):
             if "table" in metadata_dict:
                 self.metadata["table"] = metadata_dict["table"]
 
+            if "csv" in metadata_dict:
+                if isinstance(metadata_dict["csv"], dict):
+                    self.csv_options = metadata_dict["csv"]
+                else:
+                    _LOGGER.warning(
+                        f"[{self.__repr__()}] Ignoring invalid csv section in "
+                        f"{metadata_file_path}: expected a mapping"
+                    )
+
+    def _download_file(self, file_path: str, generation: int = None) -> bytes:
+        bucket_name, blob_name = file_path.split("/", 1)
+        blob = self.gcs_connector.get_blob_reference(bucket_name, blob_name)
+        data = blob.download_as_bytes()
+
+        if generation and blob.generation and blob.generation != generation:
+            _LOGGER.warning(
+                f"[{self.__repr__()}] {file_path} is at generation {blob.generation} "
+                f"but the manifest lists {generation}, manifest is stale."
+            )
+
+        return data
+
     @staticmethod
     def yaml_to_dict(yaml_str):
         try:
@@ -151,27 +185,35 @@ class AssetManager(ResourceManager):
         self.metadata["search"] = {"fields": []}
         self.metadata["table"] = {"sort": {"key": "name"}, "fields": []}
 
-        for column in columns:
-            if column not in REQUIRED_COLUMNS and column not in STRUCTURED_COLUMNS:
-                visible_key_value = {
-                    self._change_human_readable(column): f"data.{column}"
-                }
+        # Labels are resolved once per group and reused by search and table fields.
+        column_labels = {
+            column: self._change_human_readable(column)
+            for column in columns
+            if column not in REQUIRED_COLUMNS and column not in STRUCTURED_COLUMNS
+        }
+
+        for column, label in column_labels.items():
+            visible_key_value = {label: f"data.{column}"}
 
-                self.metadata["search"]["fields"].append(visible_key_value)
+            self.metadata["search"]["fields"].append(visible_key_value)
 
-                if column == self.unique_key:
-                    visible_key_value["is_optional"] = True
+            if column == self.unique_key:
+                visible_key_value["is_optional"] = True
 
-                self.metadata["table"]["fields"].append(visible_key_value)
+            self.metadata["table"]["fields"].append(visible_key_value)
 
     @staticmethod
     def _change_human_readable(column: str):
         column = column.replace("_", " ")
         return column.title()
 
-    def _get_default_resource_id(self, row: pd.Series, name: str) -> str:
-        key = self.unique_key if self.unique_key else "unique_id"
-        return row.get(
-            key,
-            f"{self.provider}:{self.cloud_service_group}:{self.cloud_service_type}:{name}",
-        )
+    def _add_default_resource_id(self, data_frame: pd.DataFrame) -> None:
+        if "resource_id" in data_frame.columns:
+            return
+
+        if self.resource_id_key in data_frame.columns:
+            data_frame["resource_id"] = data_frame[self.resource_id_key]
+        else:
+            data_frame["resource_id"] = self.resource_id_prefix + data_frame[
+                "name"
+            ].astype(str)
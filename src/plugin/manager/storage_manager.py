@@ -1,7 +1,9 @@
+import json
 import logging
 import re
 from typing import Generator, List, Dict, Any
 from collections import defaultdict
+from google.api_core.exceptions import NotFound
 from spaceone.core.manager import BaseManager
 from plugin.connector.gcs_connector import GCSConnector
 
@@ -9,6 +11,9 @@ _LOGGER = logging.getLogger("spaceone")
 
 pattern = r"provider=([^/]+)/cloud_service_group=([^/]+)/cloud_service_type=([^/]+)/.+"
 
+DEFAULT_MANIFEST_FILE = "_manifest.json"
+MANIFEST_GROUP_KEYS = ["provider", "cloud_service_group", "cloud_service_type"]
+
 
 class StorageManager(BaseManager):
 
@@ -16,22 +21,169 @@ class StorageManager(BaseManager):
         super().__init__(*args, **kwargs)
         self.gcs_connector = None
         self.bucket_name = None
+        self.manifest_groups = None
 
     def get_assets_info(self, options: dict, secret_data: dict) -> List[Dict[str, Any]]:
         self.gcs_connector = GCSConnector(options, secret_data)
         self.bucket_name = options.get("bucket_name")
 
-        bucket = self.gcs_connector.get_bucket(self.bucket_name)
-        blobs_path = [
-            blob.name for blob in bucket.list_blobs() if re.match(pattern, blob.name)
-        ]
+        manifest_file = options.get("manifest_file", DEFAULT_MANIFEST_FILE)
+        if manifest_file and (manifest := self._get_manifest(manifest_file)):
+            assets_info = self._create_assets_info_from_manifest(manifest)
+            if options.get("verify_manifest", False):
+                self.manifest_groups = {
+                    tuple(asset_info[key] for key in MANIFEST_GROUP_KEYS)
+                    for asset_info in assets_info
+                }
+            return assets_info
+
+        blobs_path = self._list_blobs_path()
 
         if not blobs_path:
             _LOGGER.debug(f"[get_assets_info] No assets found in {self.bucket_name}")
 
         return self._create_assets_info(blobs_path)
 
-    def _create_assets_info(self, blobs_path: list) -> List[Dict[str, Any]]:
+    def get_unlisted_assets_info(self) -> List[Dict[str, Any]]:
+        # Groups missing from the manifest are found with a deferred listing,
+        # after every listed group has been collected.
+        if self.manifest_groups is None:
+            return []
+
+        blobs_path = [
+            blob_path
+            for blob_path in self._list_blobs_path()
+            if tuple(re.match(pattern, blob_path).groups()) not in self.manifest_groups
+        ]
+        assets_info = [
+            asset_info
+            for asset_info in self._create_assets_info(blobs_path, mark_primary=False)
+            if "csv_file_path" in asset_info
+        ]
+
+        for asset_info in assets_info:
+            _LOGGER.warning(
+                f"[get_unlisted_assets_info] {asset_info['csv_file_path']} "
+                f"is not listed in the manifest"
+            )
+
+        return assets_info
+
+    def _list_blobs_path(self) -> List[str]:
+        bucket = self.gcs_connector.get_bucket(self.bucket_name)
+        return [
+            blob.name for blob in bucket.list_blobs() if re.match(pattern, blob.name)
+        ]
+
+    def _get_manifest(self, manifest_file: str) -> Dict[str, Any]:
+        try:
+            manifest = self.gcs_connector.download_blob(
+                self.bucket_name, manifest_file
+            )
+        except NotFound:
+            return {}
+
+        try:
+            manifest = json.loads(manifest)
+        except ValueError as e:
+            _LOGGER.error(
+                f"[get_assets_info] Invalid manifest {manifest_file}, "
+                f"listing bucket instead: {e}"
+            )
+            return {}
+
+        if not self._is_valid_manifest(manifest):
+            _LOGGER.error(
+                f"[get_assets_info] Invalid manifest {manifest_file}, "
+                f"listing bucket instead: unexpected structure"
+            )
+            return {}
+
+        return manifest
+
+    @staticmethod
+    def _is_valid_manifest(manifest: Any) -> bool:
+        if not isinstance(manifest, dict) or not isinstance(
+            manifest.get("groups"), list
+        ):
+            return False
+
+        for group in manifest["groups"]:
+            if not isinstance(group, dict) or not isinstance(group.get("files"), list):
+                return False
+
+            if not all(isinstance(group.get(key), str) for key in MANIFEST_GROUP_KEYS):
+                return False
+
+            for file in group["files"]:
+                if not isinstance(file, dict) or not isinstance(file.get("path"), str):
+                    return False
+
+                generation = file.get("generation")
+                if generation is not None and (
+                    not isinstance(generation, int) or isinstance(generation, bool)
+                ):
+                    return False
+
+        return True
+
+    def _create_assets_info_from_manifest(
+        self, manifest: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        manifest example:
+        {
+            "groups": [
+                {
+                    "provider": "google_cloud",
+                    "cloud_service_group": "Compute",
+                    "cloud_service_type": "Instance",
+                    "files": [
+                        {"path": "provider=.../instance.csv", "generation": 1700000000000000},
+                        {"path": "provider=.../metadata.yaml", "generation": 1700000000000000}
+                    ]
+                }
+            ]
+        }
+        """
+        groups = {}
+
+        # Duplicate group entries are merged like the listed blobs are.
+        for group in manifest["groups"]:
+            group_key = tuple(group[key] for key in MANIFEST_GROUP_KEYS)
+            asset_info = groups.setdefault(
+                group_key, {key: group[key] for key in MANIFEST_GROUP_KEYS}
+            )
+
+            for file in group["files"]:
+                file_path = file["path"]
+                file_name = file_path.rsplit("/", 1)[-1]
+
+                if file_name.endswith(".csv"):
+                    file_type = "csv"
+                elif file_name == "metadata.yaml" or file_name == "metadata.yml":
+                    file_type = "metadata"
+                else:
+                    continue
+
+                asset_info[f"{file_type}_file_path"] = f"{self.bucket_name}/{file_path}"
+                asset_info[f"{file_type}_generation"] = file.get("generation")
+
+        assets_info = [
+            asset_info for asset_info in groups.values() if "csv_file_path" in asset_info
+        ]
+
+        if not any("metadata_file_path" in asset_info for asset_info in assets_info):
+            if assets_info:
+                assets_info[0]["is_primary"] = True
+
+        _LOGGER.debug(f"[get_assets_info] assets_info from manifest: {assets_info}")
+
+        return assets_info
+
+    def _create_assets_info(
+        self, blobs_path: list, mark_primary: bool = True
+    ) -> List[Dict[str, Any]]:
         groups = defaultdict(dict)
 
         for blob_path in blobs_path:
@@ -70,7 +222,7 @@ class StorageManager(BaseManager):
         ]
 
         if not any("metadata_file_path" in files for files in groups.values()):
-            if assets_info:
+            if assets_info and mark_primary:
                 assets_info[0]["is_primary"] = True
 
         _LOGGER.debug(f"[get_assets_info] assets_info: {assets_info}")